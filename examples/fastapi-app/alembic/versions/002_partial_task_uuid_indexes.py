@@ -0,0 +1,38 @@
+"""Replace task_uuid indexes with partial indexes on non-null values.
+
+task_uuid is only ever looked up by value, and rows sit with a NULL
+task_uuid until their Tasker task has been created, so those rows are
+left out of the index.
+
+Revision ID: 002
+Revises: 001
+Create Date: 2026-10-16
+
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+revision = "002"
+down_revision = "001"
+branch_labels = None
+depends_on = None
+
+TABLES = ("orders", "analytics_jobs", "service_requests", "compliance_checks")
+
+
+def upgrade() -> None:
+    for table in TABLES:
+        op.drop_index(f"ix_{table}_task_uuid", table_name=table)
+        op.create_index(
+            f"ix_{table}_task_uuid",
+            table,
+            ["task_uuid"],
+            postgresql_where=sa.text("task_uuid IS NOT NULL"),
+        )
+
+
+def downgrade() -> None:
+    for table in TABLES:
+        op.drop_index(f"ix_{table}_task_uuid", table_name=table)
+        op.create_index(f"ix_{table}_task_uuid", table, ["task_uuid"])
@@ -25,14 +25,15 @@ from app.services.types import (
 def validate_eligibility(inputs: ValidatePaymentEligibilityInput, context: StepContext):
     # Input validation (required fields) is handled by the model's
     # @model_validator — see ValidatePaymentEligibilityInput in app/services/types.py.
+    # model_copy skips re-validation: inputs already passed check_required_fields.
     return svc.validate_eligibility(
-        ValidatePaymentEligibilityInput(
-            payment_id=inputs.payment_id or inputs.order_ref,
-            refund_amount=inputs.resolved_amount,
-            refund_reason=inputs.resolved_reason,
-            partial_refund=inputs.partial_refund or False,
-            order_ref=inputs.order_ref,
-            customer_email=inputs.customer_email,
+        inputs.model_copy(
+            update={
+                "payment_id": inputs.payment_id or inputs.order_ref,
+                "refund_amount": inputs.resolved_amount,
+                "refund_reason": inputs.resolved_reason,
+                "partial_refund": inputs.partial_refund or False,
+            }
         )
     )
 
@@ -10,6 +10,7 @@ StepExecutionSubscriber).
 
 from __future__ import annotations
 
+import asyncio
 import logging
 from contextlib import asynccontextmanager
 from collections.abc import AsyncGenerator
@@ -19,7 +20,10 @@ from fastapi import FastAPI
 
 load_dotenv()
 
+from tasker_core import Worker, is_worker_running
+
 from app.routes import analytics, compliance, orders, services
+from app.tasker_client import shutdown_tasker_executor
 
 logger = logging.getLogger(__name__)
 
@@ -27,22 +31,25 @@ logger = logging.getLogger(__name__)
 @asynccontextmanager
 async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     """Application lifespan: bootstrap tasker worker on startup, stop on shutdown."""
-    from tasker_core import Worker, is_worker_running
-
     worker = None
-    if not is_worker_running():
-        logger.info("Bootstrapping tasker worker...")
-        worker = Worker.start(handler_packages=["app.handlers"])
-        logger.info("Tasker worker started: worker_id=%s", worker.worker_id)
-    else:
-        logger.info("Tasker worker already running, skipping bootstrap")
-
-    yield
-
-    if worker:
-        logger.info("Stopping tasker worker...")
-        worker.stop()
-        logger.info("Tasker worker stopped")
+    try:
+        if not is_worker_running():
+            logger.info("Bootstrapping tasker worker...")
+            worker = Worker.start(handler_packages=["app.handlers"])
+            logger.info("Tasker worker started: worker_id=%s", worker.worker_id)
+        else:
+            logger.info("Tasker worker already running, skipping bootstrap")
+
+        yield
+    finally:
+        try:
+            if worker:
+                logger.info("Stopping tasker worker...")
+                worker.stop()
+                logger.info("Tasker worker stopped")
+        finally:
+            # Joins the client pool off the event loop thread.
+            await asyncio.to_thread(shutdown_tasker_executor)
 
 
 app = FastAPI(
@@ -66,8 +73,6 @@ app.include_router(compliance.router, prefix="/compliance", tags=["Team Scaling"
 @app.get("/health")
 async def health_check() -> dict:
     """Application health check endpoint."""
-    from tasker_core import is_worker_running
-
     return {
         "status": "healthy" if is_worker_running() else "degraded",
         "worker_running": is_worker_running(),
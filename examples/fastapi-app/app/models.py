@@ -1,8 +1,13 @@
 """SQLAlchemy 2.0 domain models for the FastAPI example app.
 
-Each model has a task_uuid column linking it to a Tasker orchestration task.
+Each model has a task_uuid column linking it to a Tasker orchestration task,
+indexed only where it is set (rows are NULL until their task is created).
 The models live in the app-specific database (example_fastapi), not in
 tasker's internal database.
+
+All models are mapped with eager_defaults so their server-generated
+timestamps come back via RETURNING on UPDATE as well as INSERT, letting
+routes build responses after commit without a refresh round-trip.
 """
 
 from __future__ import annotations
@@ -10,7 +15,7 @@ from __future__ import annotations
 import uuid
 from datetime import datetime
 
-from sqlalchemy import DateTime, Integer, Numeric, String, func
+from sqlalchemy import DateTime, Index, Integer, Numeric, String, func, text
 from sqlalchemy.dialects.postgresql import JSONB, UUID
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
 
@@ -25,15 +30,23 @@ class Order(Base):
     """E-commerce order tracked through the order processing workflow."""
 
     __tablename__ = "orders"
+    __mapper_args__ = {"eager_defaults": True}
+    __table_args__ = (
+        Index(
+            "ix_orders_task_uuid",
+            "task_uuid",
+            postgresql_where=text("task_uuid IS NOT NULL"),
+        ),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     customer_email: Mapped[str] = mapped_column(String(255), nullable=False)
     items: Mapped[dict] = mapped_column(JSONB, nullable=False, default=list)
-    total: Mapped[float | None] = mapped_column(Numeric(10, 2), nullable=True)
-    status: Mapped[str] = mapped_column(String(50), nullable=False, default="pending")
-    task_uuid: Mapped[uuid.UUID | None] = mapped_column(
-        UUID(as_uuid=True), nullable=True, index=True
+    total: Mapped[float | None] = mapped_column(
+        Numeric(10, 2, asdecimal=False), nullable=True
     )
+    status: Mapped[str] = mapped_column(String(50), nullable=False, default="pending")
+    task_uuid: Mapped[uuid.UUID | None] = mapped_column(UUID(as_uuid=True), nullable=True)
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), server_default=func.now(), nullable=False
     )
@@ -49,14 +62,20 @@ class AnalyticsJob(Base):
     """Data pipeline analytics job tracked through the pipeline workflow."""
 
     __tablename__ = "analytics_jobs"
+    __mapper_args__ = {"eager_defaults": True}
+    __table_args__ = (
+        Index(
+            "ix_analytics_jobs_task_uuid",
+            "task_uuid",
+            postgresql_where=text("task_uuid IS NOT NULL"),
+        ),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     source: Mapped[str] = mapped_column(String(100), nullable=False)
     dataset_url: Mapped[str | None] = mapped_column(String(500), nullable=True)
     status: Mapped[str] = mapped_column(String(50), nullable=False, default="pending")
-    task_uuid: Mapped[uuid.UUID | None] = mapped_column(
-        UUID(as_uuid=True), nullable=True, index=True
-    )
+    task_uuid: Mapped[uuid.UUID | None] = mapped_column(UUID(as_uuid=True), nullable=True)
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), server_default=func.now(), nullable=False
     )
@@ -72,15 +91,21 @@ class ServiceRequest(Base):
     """Microservices request tracked through the user registration workflow."""
 
     __tablename__ = "service_requests"
+    __mapper_args__ = {"eager_defaults": True}
+    __table_args__ = (
+        Index(
+            "ix_service_requests_task_uuid",
+            "task_uuid",
+            postgresql_where=text("task_uuid IS NOT NULL"),
+        ),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     user_id: Mapped[str] = mapped_column(String(100), nullable=False)
     request_type: Mapped[str] = mapped_column(String(100), nullable=False)
     status: Mapped[str] = mapped_column(String(50), nullable=False, default="pending")
     result: Mapped[dict | None] = mapped_column(JSONB, nullable=True)
-    task_uuid: Mapped[uuid.UUID | None] = mapped_column(
-        UUID(as_uuid=True), nullable=True, index=True
-    )
+    task_uuid: Mapped[uuid.UUID | None] = mapped_column(UUID(as_uuid=True), nullable=True)
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), server_default=func.now(), nullable=False
     )
@@ -96,14 +121,20 @@ class ComplianceCheck(Base):
     """Compliance check tracked through the team scaling workflow."""
 
     __tablename__ = "compliance_checks"
+    __mapper_args__ = {"eager_defaults": True}
+    __table_args__ = (
+        Index(
+            "ix_compliance_checks_task_uuid",
+            "task_uuid",
+            postgresql_where=text("task_uuid IS NOT NULL"),
+        ),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     order_ref: Mapped[str] = mapped_column(String(100), nullable=False)
     namespace: Mapped[str] = mapped_column(String(100), nullable=False)
     status: Mapped[str] = mapped_column(String(50), nullable=False, default="pending")
-    task_uuid: Mapped[uuid.UUID | None] = mapped_column(
-        UUID(as_uuid=True), nullable=True, index=True
-    )
+    task_uuid: Mapped[uuid.UUID | None] = mapped_column(UUID(as_uuid=True), nullable=True)
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), server_default=func.now(), nullable=False
     )
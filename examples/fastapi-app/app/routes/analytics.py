@@ -10,12 +10,12 @@ import logging
 import uuid
 
 from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.database import get_db
 from app.models import AnalyticsJob
 from app.schemas import CreateAnalyticsJobRequest, AnalyticsJobResponse
+from app.tasker_client import get_tasker_client, run_tasker_call
 
 logger = logging.getLogger(__name__)
 router = APIRouter()
@@ -31,19 +31,18 @@ async def create_analytics_job(
     Creates a domain record then creates a Tasker task for the 8-step pipeline:
     3 parallel extracts -> 3 transforms -> aggregate metrics -> generate insights.
     """
-    from tasker_core.client import TaskerClient
-
     job = AnalyticsJob(
         source=request.source,
         dataset_url=request.dataset_url,
         status="pending",
     )
     db.add(job)
-    await db.flush()
+    await db.commit()
 
-    client = TaskerClient(initiator="fastapi-example", source_system="fastapi-example")
+    client = get_tasker_client()
     try:
-        task_response = client.create_task(
+        task_response = await run_tasker_call(
+            client.create_task,
             "analytics_pipeline",
             namespace="data_pipeline_py",
             context={
@@ -65,7 +64,6 @@ async def create_analytics_job(
         job.status = "task_creation_failed"
 
     await db.commit()
-    await db.refresh(job)
 
     return AnalyticsJobResponse(
         id=job.id,
@@ -84,18 +82,16 @@ async def get_analytics_job(
     db: AsyncSession = Depends(get_db),
 ) -> AnalyticsJobResponse:
     """Get analytics job details with current workflow task status."""
-    from tasker_core.client import TaskerClient
-
-    result = await db.execute(select(AnalyticsJob).where(AnalyticsJob.id == job_id))
-    job = result.scalar_one_or_none()
+    job = await db.get(AnalyticsJob, job_id)
     if job is None:
         raise HTTPException(status_code=404, detail="Analytics job not found")
 
     task_status = None
     if job.task_uuid:
         try:
-            client = TaskerClient(initiator="fastapi-example", source_system="fastapi-example")
-            task_status = client.get_task(str(job.task_uuid)).__dict__
+            client = get_tasker_client()
+            task = await run_tasker_call(client.get_task, str(job.task_uuid))
+            task_status = task.__dict__
         except Exception:
             logger.exception(
                 "Failed to fetch task status for analytics job %d", job.id
@@ -13,12 +13,12 @@ import logging
 import uuid
 
 from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.database import get_db
 from app.models import ComplianceCheck
 from app.schemas import CreateComplianceCheckRequest, ComplianceCheckResponse
+from app.tasker_client import get_tasker_client, run_tasker_call
 
 logger = logging.getLogger(__name__)
 router = APIRouter()
@@ -28,6 +28,7 @@ TEMPLATE_MAP = {
     "customer_success_py": "process_refund",
     "payments_py": "process_refund",
 }
+_VALID_NAMESPACES = ", ".join(TEMPLATE_MAP)
 
 
 @router.post("/checks/", response_model=ComplianceCheckResponse, status_code=201)
@@ -41,7 +42,12 @@ async def create_compliance_check(
     Payments (4 steps) workflow is started. Each namespace has its own
     handlers, demonstrating team scaling with independent ownership.
     """
-    from tasker_core.client import TaskerClient
+    template_name = TEMPLATE_MAP.get(request.namespace)
+    if template_name is None:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Unknown namespace: {request.namespace}. Valid: {_VALID_NAMESPACES}",
+        )
 
     check = ComplianceCheck(
         order_ref=request.order_ref,
@@ -49,19 +55,12 @@ async def create_compliance_check(
         status="pending",
     )
     db.add(check)
-    await db.flush()
-
-    template_name = TEMPLATE_MAP.get(request.namespace)
-    if template_name is None:
-        raise HTTPException(
-            status_code=400,
-            detail=f"Unknown namespace: {request.namespace}. "
-            f"Valid: {', '.join(TEMPLATE_MAP.keys())}",
-        )
+    await db.commit()
 
-    client = TaskerClient(initiator="fastapi-example", source_system="fastapi-example")
+    client = get_tasker_client()
     try:
-        task_response = client.create_task(
+        task_response = await run_tasker_call(
+            client.create_task,
             template_name,
             namespace=request.namespace,
             context={
@@ -84,7 +83,6 @@ async def create_compliance_check(
         check.status = "task_creation_failed"
 
     await db.commit()
-    await db.refresh(check)
 
     return ComplianceCheckResponse(
         id=check.id,
@@ -103,20 +101,16 @@ async def get_compliance_check(
     db: AsyncSession = Depends(get_db),
 ) -> ComplianceCheckResponse:
     """Get compliance check details with current workflow task status."""
-    from tasker_core.client import TaskerClient
-
-    result = await db.execute(
-        select(ComplianceCheck).where(ComplianceCheck.id == check_id)
-    )
-    check = result.scalar_one_or_none()
+    check = await db.get(ComplianceCheck, check_id)
     if check is None:
         raise HTTPException(status_code=404, detail="Compliance check not found")
 
     task_status = None
     if check.task_uuid:
         try:
-            client = TaskerClient(initiator="fastapi-example", source_system="fastapi-example")
-            task_status = client.get_task(str(check.task_uuid)).__dict__
+            client = get_tasker_client()
+            task = await run_tasker_call(client.get_task, str(check.task_uuid))
+            task_status = task.__dict__
         except Exception:
             logger.exception(
                 "Failed to fetch task status for compliance check %d", check.id
@@ -11,12 +11,12 @@ import logging
 import uuid
 
 from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException
-from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.database import async_session_factory, get_db
 from app.models import Order
 from app.schemas import CreateOrderRequest, OrderResponse
+from app.tasker_client import get_tasker_client, run_tasker_call
 
 logger = logging.getLogger(__name__)
 router = APIRouter()
@@ -33,27 +33,30 @@ async def create_order(
     to orchestrate the 5-step processing pipeline: validate cart, process
     payment, update inventory, create order, send confirmation.
     """
-    from tasker_core.client import TaskerClient
+    items = [item.model_dump() for item in request.items]
 
     # Create the domain record
     order = Order(
         customer_email=request.customer_email,
-        items=[item.model_dump() for item in request.items],
+        items=items,
         status="pending",
     )
     db.add(order)
-    await db.flush()
+    # Commit the domain row before calling the orchestrator so no transaction
+    # (and no pooled connection) is held open for the duration of the RPC.
+    await db.commit()
 
     # Create the tasker task
-    client = TaskerClient(initiator="fastapi-example", source_system="fastapi-example")
+    client = get_tasker_client()
     try:
-        task_response = client.create_task(
+        task_response = await run_tasker_call(
+            client.create_task,
             "ecommerce_order_processing",
             namespace="ecommerce_py",
             context={
                 "order_id": order.id,
                 "customer_email": request.customer_email,
-                "items": [item.model_dump() for item in request.items],
+                "items": items,
                 "payment_token": request.payment_token,
                 "shipping_address": request.shipping_address,
             },
@@ -68,13 +71,12 @@ async def create_order(
         order.status = "task_creation_failed"
 
     await db.commit()
-    await db.refresh(order)
 
     return OrderResponse(
         id=order.id,
         customer_email=order.customer_email,
-        items=order.items,
-        total=float(order.total) if order.total else None,
+        items=items,
+        total=order.total,
         status=order.status,
         task_uuid=order.task_uuid,
         created_at=order.created_at,
@@ -84,24 +86,22 @@ async def create_order(
 
 async def _create_task_for_order(order_id: int, request: CreateOrderRequest) -> None:
     """Background task: create the Tasker workflow for an order."""
-    from tasker_core.client import TaskerClient
-
     async with async_session_factory() as db:
-        result = await db.execute(select(Order).where(Order.id == order_id))
-        order = result.scalar_one_or_none()
+        order = await db.get(Order, order_id)
         if order is None:
             logger.error("Background task: order %d not found", order_id)
             return
 
-        client = TaskerClient(initiator="fastapi-example", source_system="fastapi-example")
+        client = get_tasker_client()
         try:
-            task_response = client.create_task(
+            task_response = await run_tasker_call(
+                client.create_task,
                 "ecommerce_order_processing",
                 namespace="ecommerce_py",
                 context={
                     "order_id": order.id,
                     "customer_email": request.customer_email,
-                    "items": [item.model_dump() for item in request.items],
+                    "items": order.items,
                     "payment_token": request.payment_token,
                     "shipping_address": request.shipping_address,
                 },
@@ -136,7 +136,6 @@ async def create_order_async(
     )
     db.add(order)
     await db.commit()
-    await db.refresh(order)
 
     background_tasks.add_task(_create_task_for_order, order.id, request)
 
@@ -144,7 +143,7 @@ async def create_order_async(
         id=order.id,
         customer_email=order.customer_email,
         items=order.items,
-        total=float(order.total) if order.total else None,
+        total=order.total,
         status=order.status,
         task_uuid=order.task_uuid,
         created_at=order.created_at,
@@ -158,18 +157,16 @@ async def get_order(
     db: AsyncSession = Depends(get_db),
 ) -> OrderResponse:
     """Get order details with current workflow task status."""
-    from tasker_core.client import TaskerClient
-
-    result = await db.execute(select(Order).where(Order.id == order_id))
-    order = result.scalar_one_or_none()
+    order = await db.get(Order, order_id)
     if order is None:
         raise HTTPException(status_code=404, detail="Order not found")
 
     task_status = None
     if order.task_uuid:
         try:
-            client = TaskerClient(initiator="fastapi-example", source_system="fastapi-example")
-            task_status = client.get_task(str(order.task_uuid)).__dict__
+            client = get_tasker_client()
+            task = await run_tasker_call(client.get_task, str(order.task_uuid))
+            task_status = task.__dict__
         except Exception:
             logger.exception("Failed to fetch task status for order %d", order.id)
 
@@ -177,7 +174,7 @@ async def get_order(
         id=order.id,
         customer_email=order.customer_email,
         items=order.items,
-        total=float(order.total) if order.total else None,
+        total=order.total,
         status=order.status,
         task_uuid=order.task_uuid,
         created_at=order.created_at,
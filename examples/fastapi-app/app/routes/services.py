@@ -10,12 +10,12 @@ import logging
 import uuid
 
 from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.database import get_db
 from app.models import ServiceRequest
 from app.schemas import CreateServiceRequest, ServiceRequestResponse
+from app.tasker_client import get_tasker_client, run_tasker_call
 
 logger = logging.getLogger(__name__)
 router = APIRouter()
@@ -31,19 +31,18 @@ async def create_service_request(
     Creates a domain record then creates a Tasker task for the 5-step pipeline:
     CreateUser -> (SetupBilling || InitPreferences) -> SendWelcome -> UpdateStatus.
     """
-    from tasker_core.client import TaskerClient
-
     svc_request = ServiceRequest(
         user_id=request.user_id,
         request_type=request.request_type,
         status="pending",
     )
     db.add(svc_request)
-    await db.flush()
+    await db.commit()
 
-    client = TaskerClient(initiator="fastapi-example", source_system="fastapi-example")
+    client = get_tasker_client()
     try:
-        task_response = client.create_task(
+        task_response = await run_tasker_call(
+            client.create_task,
             "user_registration",
             namespace="microservices_py",
             context={
@@ -68,7 +67,6 @@ async def create_service_request(
         svc_request.status = "task_creation_failed"
 
     await db.commit()
-    await db.refresh(svc_request)
 
     return ServiceRequestResponse(
         id=svc_request.id,
@@ -88,20 +86,16 @@ async def get_service_request(
     db: AsyncSession = Depends(get_db),
 ) -> ServiceRequestResponse:
     """Get service request details with current workflow task status."""
-    from tasker_core.client import TaskerClient
-
-    result = await db.execute(
-        select(ServiceRequest).where(ServiceRequest.id == request_id)
-    )
-    svc_request = result.scalar_one_or_none()
+    svc_request = await db.get(ServiceRequest, request_id)
     if svc_request is None:
         raise HTTPException(status_code=404, detail="Service request not found")
 
     task_status = None
     if svc_request.task_uuid:
         try:
-            client = TaskerClient(initiator="fastapi-example", source_system="fastapi-example")
-            task_status = client.get_task(str(svc_request.task_uuid)).__dict__
+            client = get_tasker_client()
+            task = await run_tasker_call(client.get_task, str(svc_request.task_uuid))
+            task_status = task.__dict__
         except Exception:
             logger.exception(
                 "Failed to fetch task status for service request %d", svc_request.id
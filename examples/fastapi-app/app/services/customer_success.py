@@ -8,7 +8,9 @@ models out.
 from __future__ import annotations
 
 import hashlib
+import os
 import uuid
+import zlib
 from datetime import datetime, timedelta, timezone
 from tasker_core.errors import PermanentError, RetryableError
 
@@ -33,11 +35,14 @@ VALID_REASONS = {
     "duplicate_charge",
     "service_issue",
 }
+_VALID_REASONS_SORTED_STR = ", ".join(sorted(VALID_REASONS))
 
 MAX_REFUND_AMOUNT = 10000.00
+_MAX_REFUND_AMOUNT_STR = f"${MAX_REFUND_AMOUNT:.2f}"
 AUTO_APPROVE_THRESHOLD = 50.00
 REVIEW_THRESHOLD = 500.00
 AUTO_APPROVE_REASONS = {"defective_product", "wrong_item", "duplicate_charge"}
+_MANAGERS = ("mgr_1", "mgr_2", "mgr_3", "mgr_4", "mgr_5")
 
 
 # ---------------------------------------------------------------------------
@@ -63,19 +68,21 @@ def validate_refund_request(
 
     if amount > MAX_REFUND_AMOUNT:
         raise PermanentError(
-            f"Refund amount ${amount:.2f} exceeds maximum ${MAX_REFUND_AMOUNT:.2f}"
+            f"Refund amount ${amount:.2f} exceeds maximum {_MAX_REFUND_AMOUNT_STR}"
         )
 
     if reason and reason not in VALID_REASONS:
         raise PermanentError(
-            f"Invalid refund reason: {reason}. Valid: {', '.join(sorted(VALID_REASONS))}"
+            f"Invalid refund reason: {reason}. Valid: {_VALID_REASONS_SORTED_STR}"
         )
 
-    request_id = f"ref_{uuid.uuid4().hex[:12]}"
-    validation_hash = hashlib.sha256(
-        f"{order_ref}:{amount}:{reason}:{input.customer_email}".encode()
-    ).hexdigest()[:16]
-    payment_id = f"pay_{uuid.uuid4().hex[:12]}"
+    rnd = os.urandom(12).hex()
+    request_id = f"ref_{rnd[:12]}"
+    # Non-cryptographic correlation key; 64 bits is all the hash ever carried.
+    validation_hash = hashlib.blake2b(
+        f"{order_ref}:{amount}:{reason}:{input.customer_email}".encode(), digest_size=8
+    ).hexdigest()
+    payment_id = f"pay_{rnd[12:]}"
 
     # Determine customer tier based on customer_id
     customer_tier = "standard"
@@ -85,8 +92,9 @@ def validate_refund_request(
     elif "gold" in cid:
         customer_tier = "gold"
 
-    original_purchase_date = (datetime.now(timezone.utc) - timedelta(days=30)).isoformat()
-    now = datetime.now(timezone.utc).isoformat()
+    now_dt = datetime.now(timezone.utc)
+    original_purchase_date = (now_dt - timedelta(days=30)).isoformat()
+    now = now_dt.isoformat()
 
     return CustomerSuccessValidateRefundResult(
         request_validated=True,
@@ -137,8 +145,9 @@ def check_refund_policy(
         approval_path = "standard_review"
         requires_approval = True
 
-    policy_id = f"pol_{uuid.uuid4().hex[:10]}"
-    now = datetime.now(timezone.utc).isoformat()
+    policy_id = f"pol_{os.urandom(5).hex()}"
+    now_dt = datetime.now(timezone.utc)
+    now = now_dt.isoformat()
 
     # Compute days since purchase if available
     days_since_purchase = 30  # default
@@ -148,7 +157,7 @@ def check_refund_policy(
             purchase_date = datetime.fromisoformat(
                 original_purchase_date.replace("Z", "+00:00")
             )
-            days_since_purchase = (datetime.now(timezone.utc) - purchase_date).days
+            days_since_purchase = (now_dt - purchase_date).days
         except (ValueError, TypeError):
             pass
 
@@ -199,11 +208,13 @@ def approve_refund(
     ticket_id = validation.ticket_id
     customer_id = validation.customer_id
 
-    approval_id = f"apr_{uuid.uuid4().hex[:12]}"
+    approval_id = f"apr_{os.urandom(6).hex()}"
     now = datetime.now(timezone.utc).isoformat()
 
     if requires_approval:
-        manager_id = f"mgr_{(hash(ticket_id or '') % 5) + 1}"
+        # CRC32 rather than hash(): str hashes are salted per process, and the
+        # same ticket should land on the same manager across workers.
+        manager_id = _MANAGERS[zlib.crc32((ticket_id or "").encode()) % len(_MANAGERS)]
         manager_notes = f"Manager-approved refund of ${amount:.2f} for customer {customer_id}"
 
         return CustomerSuccessApproveRefundResult(
@@ -254,11 +265,13 @@ def execute_refund(
     amount = refund_amount or approval.amount_approved or 0.0
     request_id = validation.request_id
     order_ref = validation.order_ref
-    correlation_id = correlation_id or f"cs-{uuid.uuid4().hex[:16]}"
 
+    # One CSPRNG draw sliced into the refund, transaction and correlation IDs.
+    rnd = os.urandom(22).hex()
+    refund_id = f"rfnd_{rnd[:12]}"
+    transaction_ref = f"txn_{rnd[12:28]}"
+    correlation_id = correlation_id or f"cs-{rnd[28:]}"
     delegated_task_id = f"task_{uuid.uuid4()}"
-    refund_id = f"rfnd_{uuid.uuid4().hex[:12]}"
-    transaction_ref = f"txn_{uuid.uuid4().hex[:16]}"
     now = datetime.now(timezone.utc).isoformat()
 
     return CustomerSuccessExecuteRefundResult(
@@ -314,7 +327,7 @@ def update_ticket(
 
     return CustomerSuccessUpdateTicketResult(
         ticket_updated=True,
-        ticket_id=ticket_id or f"tkt_{uuid.uuid4().hex[:12]}",
+        ticket_id=ticket_id or f"tkt_{os.urandom(6).hex()}",
         previous_status="in_progress",
         new_status="resolved",
         resolution_note=resolution_note,
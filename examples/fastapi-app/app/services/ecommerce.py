@@ -7,9 +7,11 @@ conversion happens at the boundary (validate_cart_items).
 
 from __future__ import annotations
 
+import functools
 import hashlib
-import uuid
-from datetime import datetime, timedelta, timezone
+import operator
+import os
+from datetime import date, datetime, timedelta, timezone
 from typing import Any
 
 from tasker_core.errors import PermanentError, RetryableError
@@ -34,6 +36,14 @@ STANDARD_SHIPPING = 9.99
 DECLINED_TOKENS = {"tok_test_declined", "tok_test_insufficient_funds"}
 ERROR_TOKENS = {"tok_test_gateway_error", "tok_test_timeout"}
 
+_CART_ITEM_FIELDS = operator.itemgetter("sku", "name", "quantity", "unit_price")
+
+
+@functools.lru_cache(maxsize=2)
+def _order_date_prefix(ordinal: int) -> str:
+    """Format a day ordinal as ``YYYYMMDD``; the date only changes once a day."""
+    return date.fromordinal(ordinal).strftime("%Y%m%d")
+
 
 # ---------------------------------------------------------------------------
 # Service functions
@@ -52,14 +62,16 @@ def validate_cart_items(
     if not cart_items or not isinstance(cart_items, list):
         raise PermanentError("Cart is empty or items field is missing")
 
-    validated_items: list[EcommerceCartItem] = []
-    subtotal = 0.0
+    rows: list[tuple[str, str, int, float]] = []
 
     for idx, item in enumerate(cart_items):
-        sku = item.get("sku")
-        name = item.get("name")
-        quantity = item.get("quantity", 0)
-        unit_price = item.get("unit_price", 0.0)
+        try:
+            sku, name, quantity, unit_price = _CART_ITEM_FIELDS(item)
+        except KeyError:
+            sku = item.get("sku")
+            name = item.get("name")
+            quantity = item.get("quantity", 0)
+            unit_price = item.get("unit_price", 0.0)
 
         if not sku or not name:
             raise PermanentError(f"Item at index {idx} missing sku or name")
@@ -70,19 +82,20 @@ def validate_cart_items(
         if unit_price <= 0:
             raise PermanentError(f"Item '{sku}' has invalid price: {unit_price}")
 
-        line_total = round(quantity * unit_price, 2)
-        subtotal += line_total
-        validated_items.append(
-            EcommerceCartItem(
-                sku=sku,
-                name=name,
-                quantity=quantity,
-                unit_price=unit_price,
-                line_total=line_total,
-            )
+        rows.append((sku, name, quantity, unit_price))
+
+    validated_items = [
+        EcommerceCartItem(
+            sku=sku,
+            name=name,
+            quantity=quantity,
+            unit_price=unit_price,
+            line_total=round(quantity * unit_price, 2),
         )
+        for sku, name, quantity, unit_price in rows
+    ]
 
-    subtotal = round(subtotal, 2)
+    subtotal = round(sum(item.line_total for item in validated_items), 2)
     tax = round(subtotal * TAX_RATE, 2)
     shipping = 0.0 if subtotal >= FREE_SHIPPING_THRESHOLD else STANDARD_SHIPPING
     total = round(subtotal + tax + shipping, 2)
@@ -112,11 +125,12 @@ def process_payment(
     if payment_token in ERROR_TOKENS:
         raise RetryableError("Payment gateway returned an error, will retry")
 
-    transaction_id = f"txn_{uuid.uuid4().hex[:16]}"
-    authorization_code = hashlib.sha256(
-        f"{payment_token}:{total}:{transaction_id}".encode()
-    ).hexdigest()[:12].upper()
-    payment_id = f"pay_{uuid.uuid4().hex[:12]}"
+    transaction_id = f"txn_{os.urandom(8).hex()}"
+    auth_digest = hashlib.blake2b(
+        f"{payment_token}:{total}:{transaction_id}".encode(), digest_size=6
+    ).digest()
+    authorization_code = f"{int.from_bytes(auth_digest, 'big'):012X}"
+    payment_id = f"pay_{os.urandom(6).hex()}"
 
     return EcommerceProcessPaymentResult(
         payment_id=payment_id,
@@ -135,37 +149,34 @@ def update_inventory(
     validated_items: list[EcommerceCartItem],
 ) -> EcommerceUpdateInventoryResult:
     """Create inventory reservations for validated cart items."""
-    updated_products: list[dict[str, Any]] = []
-    inventory_changes: list[dict[str, Any]] = []
-    total_items_reserved = 0
-
-    for item in validated_items:
-        reservation_id = f"res_{uuid.uuid4().hex[:12]}"
-        total_items_reserved += item.quantity
-
-        updated_products.append(
-            {
-                "product_id": item.sku,
-                "name": item.name,
-                "quantity_reserved": item.quantity,
-                "reservation_id": reservation_id,
-                "warehouse": "WH-EAST-01",
-                "status": "reserved",
-            }
-        )
-
-        inventory_changes.append(
-            {
-                "product_id": item.sku,
-                "change_type": "reservation",
-                "quantity": -item.quantity,
-                "reason": "order_checkout",
-                "reservation_id": reservation_id,
-                "inventory_log_id": f"log_{uuid.uuid4().hex[:6]}",
-            }
-        )
-
-    inventory_log_id = f"log_{uuid.uuid4().hex[:8]}"
+    # One CSPRNG draw for the whole cart, sliced into 6-byte reservation IDs.
+    raw = os.urandom(6 * len(validated_items))
+    updated_products: list[dict[str, Any]] = [
+        {
+            "product_id": item.sku,
+            "name": item.name,
+            "quantity_reserved": item.quantity,
+            "reservation_id": f"res_{raw[offset:offset + 6].hex()}",
+            "warehouse": "WH-EAST-01",
+            "status": "reserved",
+        }
+        for offset, item in zip(range(0, len(raw), 6), validated_items)
+    ]
+    total_items_reserved = sum(item.quantity for item in validated_items)
+
+    # Change-log entries mirror the reservations, so derive them afterwards.
+    inventory_changes = [
+        {
+            "product_id": product["product_id"],
+            "change_type": "reservation",
+            "quantity": -product["quantity_reserved"],
+            "reason": "order_checkout",
+            "reservation_id": product["reservation_id"],
+        }
+        for product in updated_products
+    ]
+
+    inventory_log_id = f"log_{os.urandom(4).hex()}"
 
     return EcommerceUpdateInventoryResult(
         updated_products=updated_products,
@@ -183,12 +194,11 @@ def create_order(
     customer_email: str | None,
 ) -> EcommerceCreateOrderResult:
     """Create the final order record by aggregating upstream data."""
-    order_id = f"ORD-{uuid.uuid4().hex[:8].upper()}"
-    order_number = f"ORD-{datetime.now(timezone.utc).strftime('%Y%m%d')}-{uuid.uuid4().hex[:8].upper()}"
+    now = datetime.now(timezone.utc)
+    order_id = f"ORD-{os.urandom(4).hex().upper()}"
+    order_number = f"ORD-{_order_date_prefix(now.toordinal())}-{os.urandom(4).hex().upper()}"
     total_amount = cart.total
-    estimated_delivery = (datetime.now(timezone.utc) + timedelta(days=7)).strftime(
-        "%B %d, %Y"
-    )
+    estimated_delivery = (now + timedelta(days=7)).strftime("%B %d, %Y")
 
     return EcommerceCreateOrderResult(
         order_id=order_id,
@@ -207,7 +217,7 @@ def create_order(
         updated_products=inventory.updated_products,
         inventory_log_id=inventory.inventory_log_id,
         status="confirmed",
-        created_at=datetime.now(timezone.utc).isoformat(),
+        created_at=now.isoformat(),
         estimated_delivery=estimated_delivery,
     )
 
@@ -217,7 +227,7 @@ def send_confirmation(
     customer_email: str | None,
 ) -> EcommerceSendConfirmationResult:
     """Send order confirmation email to customer."""
-    message_id = f"msg_{uuid.uuid4().hex[:16]}"
+    message_id = f"msg_{os.urandom(8).hex()}"
     customer_email = customer_email or order.customer_email or "unknown@example.com"
     order_id = order.order_id or "UNKNOWN"
     total = order.total or 0.0
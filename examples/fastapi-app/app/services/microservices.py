@@ -14,9 +14,12 @@ Diamond dependency pattern:
 from __future__ import annotations
 
 import hashlib
-import uuid
+import os
+import time
+from collections.abc import Mapping
 from datetime import datetime, timedelta, timezone
-from typing import Any
+from types import MappingProxyType
+from typing import Any, NamedTuple
 
 from tasker_core.errors import PermanentError, RetryableError
 
@@ -33,7 +36,7 @@ from .types import (
 # Constants
 # ---------------------------------------------------------------------------
 
-RESERVED_USERNAMES = {"admin", "root", "system", "support", "test"}
+RESERVED_USERNAMES = frozenset({"admin", "root", "system", "support", "test"})
 
 PLAN_PRICING = {
     "starter": {"monthly_price": 0.0, "annual_price": 0.0, "trial_days": 0},
@@ -47,6 +50,127 @@ PLAN_LIMITS = {
     "enterprise": {"api_calls": -1, "storage_gb": 500, "team_members": -1},
 }
 
+# The verification email and in-app onboarding tour are always sent, so every
+# welcome sequence touches exactly these channels.
+WELCOME_CHANNELS = ("email", "in_app")
+
+UI_SETTINGS: Mapping[str, Any] = MappingProxyType({
+    "theme": "light",
+    "language": "en",
+    "timezone": "UTC",
+    "date_format": "YYYY-MM-DD",
+    "items_per_page": 25,
+    "sidebar_collapsed": False,
+})
+
+
+# ---------------------------------------------------------------------------
+# Plan templates
+# ---------------------------------------------------------------------------
+#
+# Everything below is a pure function of the plan name, so the known plans
+# are built once at import time. Result models copy these mappings on
+# construction, so sharing read-only views across calls is safe.
+
+
+class _BillingTemplate(NamedTuple):
+    pricing: Mapping[str, Any]
+    limits: Mapping[str, Any]
+    features: tuple[str, ...]
+    billing_required: bool
+    status: str
+
+
+class _PreferencesTemplate(NamedTuple):
+    notifications: Mapping[str, bool]
+    feature_flags: Mapping[str, bool]
+    defaults: Mapping[str, Any]
+
+
+def _build_preferences_template(plan: str) -> _PreferencesTemplate:
+    """Build the plan-dependent notification and feature-flag defaults."""
+    notifications = {
+        "email_updates": True,
+        "marketing_emails": plan != "enterprise",
+        "weekly_digest": True,
+        "security_alerts": True,
+        "product_updates": True,
+        "billing_alerts": plan != "starter",
+    }
+    feature_flags = {
+        "beta_features": plan == "enterprise",
+        "advanced_analytics": plan in ("professional", "enterprise"),
+        "api_access": plan in ("professional", "enterprise"),
+        "custom_integrations": plan == "enterprise",
+        "priority_support": plan == "enterprise",
+        "export_data": True,
+    }
+    return _PreferencesTemplate(
+        notifications=MappingProxyType(notifications),
+        feature_flags=MappingProxyType(feature_flags),
+        defaults=MappingProxyType({**notifications, **UI_SETTINGS}),
+    )
+
+
+_BILLING_TEMPLATES: dict[str, _BillingTemplate] = {
+    plan: _BillingTemplate(
+        pricing=MappingProxyType(pricing),
+        limits=MappingProxyType(PLAN_LIMITS[plan]),
+        features=tuple(PLAN_LIMITS[plan]),
+        billing_required=pricing["monthly_price"] > 0,
+        status="active" if pricing["monthly_price"] > 0 else "skipped_free_plan",
+    )
+    for plan, pricing in PLAN_PRICING.items()
+}
+
+_PREFERENCES_TEMPLATES: dict[str, _PreferencesTemplate] = {
+    plan: _build_preferences_template(plan) for plan in PLAN_PRICING
+}
+
+# Welcome-sequence messages as recorded in messages_sent_details. The result
+# contract only carries channel/template/status, so each possible sequence is
+# built once, keyed by (welcome email enabled, trial started).
+_WELCOME_EMAIL = {"channel": "email", "template": "welcome_email_v3", "status": "sent"}
+_VERIFICATION_EMAIL = {"channel": "email", "template": "email_verification", "status": "sent"}
+_ONBOARDING_TOUR = {"channel": "in_app", "template": "onboarding_tour", "status": "queued"}
+_TRIAL_STARTED_EMAIL = {"channel": "email", "template": "trial_started", "status": "sent"}
+
+_WELCOME_SEQUENCES: dict[tuple[bool, bool], tuple[dict[str, str], ...]] = {
+    (welcome, trial): (
+        *((_WELCOME_EMAIL,) if welcome else ()),
+        _VERIFICATION_EMAIL,
+        _ONBOARDING_TOUR,
+        *((_TRIAL_STARTED_EMAIL,) if trial else ()),
+    )
+    for welcome in (False, True)
+    for trial in (False, True)
+}
+
+
+# ---------------------------------------------------------------------------
+# Timestamps
+# ---------------------------------------------------------------------------
+
+_iso_second: tuple[int, str] = (-1, "")
+
+
+def _utc_now_iso() -> str:
+    """Return the current UTC time in ``datetime.isoformat()`` layout.
+
+    Registrations arriving within the same second share the formatted
+    ``YYYY-MM-DDTHH:MM:SS`` prefix, so most calls only format microseconds.
+    """
+    global _iso_second
+    sec, usec = divmod(time.time_ns() // 1000, 1_000_000)
+    cached_sec, prefix = _iso_second
+    if sec != cached_sec:
+        prefix = time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(sec))
+        _iso_second = (sec, prefix)
+    if not usec:
+        # isoformat() drops the fractional part on a whole second.
+        return f"{prefix}+00:00"
+    return f"{prefix}.{usec:06d}+00:00"
+
 
 # ---------------------------------------------------------------------------
 # Service functions
@@ -66,25 +190,27 @@ def create_user_account(
     assert email is not None
     assert full_name is not None
 
-    if "@" not in email:
+    local_part, at, _ = email.partition("@")
+    if not at:
         raise PermanentError(f"Invalid email address: {email}")
 
     if len(full_name.strip()) < 2:
         raise PermanentError("Name must be at least 2 characters")
 
-    username = input.username or email.split("@")[0].lower()
-    if username.lower() in RESERVED_USERNAMES:
+    derived_username = local_part.lower()
+    username = input.username or derived_username
+    # The derived name is already lowercase; only a supplied username needs folding.
+    if (username.lower() if input.username else username) in RESERVED_USERNAMES:
         raise PermanentError(f"Username '{username}' is reserved")
 
-    internal_id = f"usr_{uuid.uuid4().hex[:12]}"
-    derived_username = email.split("@")[0].lower()
-    user_id = username or derived_username
-    verification_token = hashlib.sha256(
-        f"{internal_id}:{email}:{datetime.now(timezone.utc).isoformat()}".encode()
-    ).hexdigest()[:32]
+    internal_id = f"usr_{os.urandom(6).hex()}"
+    now = _utc_now_iso()
+    verification_token = hashlib.blake2b(
+        f"{internal_id}:{email}:{now}".encode(), digest_size=16
+    ).hexdigest()
 
     return MicroservicesCreateUserResult(
-        user_id=user_id,
+        user_id=username,
         email=email,
         name=full_name,
         plan=plan,
@@ -98,7 +224,7 @@ def create_user_account(
         verification_token=verification_token,
         email_verified=False,
         account_status="pending_verification",
-        created_at=datetime.now(timezone.utc).isoformat(),
+        created_at=now,
     )
 
 
@@ -113,26 +239,21 @@ def setup_billing_profile(
     plan = user_data.plan or "starter"
     internal_id = user_data.internal_id
 
-    pricing = PLAN_PRICING.get(plan, PLAN_PRICING["starter"])
-    limits = PLAN_LIMITS.get(plan, PLAN_LIMITS["starter"])
-    billing_required = pricing["monthly_price"] > 0
+    template = _BILLING_TEMPLATES.get(plan) or _BILLING_TEMPLATES["starter"]
+    pricing = template.pricing
+    billing_required = template.billing_required
 
-    billing_id = f"bill_{uuid.uuid4().hex[:12]}"
-    subscription_id = f"sub_{uuid.uuid4().hex[:12]}"
+    billing_id = f"bill_{os.urandom(6).hex()}"
+    subscription_id = f"sub_{os.urandom(6).hex()}"
 
+    now = datetime.now(timezone.utc)
     trial_end = None
     next_billing_date = None
     if pricing["trial_days"] > 0:
-        trial_end = (
-            datetime.now(timezone.utc) + timedelta(days=pricing["trial_days"])
-        ).isoformat()
+        trial_end = (now + timedelta(days=pricing["trial_days"])).isoformat()
 
     if billing_required:
-        next_billing_date = (
-            datetime.now(timezone.utc) + timedelta(days=30)
-        ).isoformat()
-
-    now = datetime.now(timezone.utc).isoformat()
+        next_billing_date = (now + timedelta(days=30)).isoformat()
 
     return MicroservicesSetupBillingResult(
         billing_id=billing_id,
@@ -141,18 +262,18 @@ def setup_billing_profile(
         price=pricing["monthly_price"],
         currency="USD",
         billing_cycle="monthly",
-        features=list(limits.keys()),
-        status="active" if billing_required else "skipped_free_plan",
+        features=template.features,
+        status=template.status,
         billing_required=billing_required,
         next_billing_date=next_billing_date,
         subscription_id=subscription_id,
         user_internal_id=internal_id,
         pricing=pricing,
-        limits=limits,
+        limits=template.limits,
         billing_status="trial" if trial_end else "active",
         trial_end=trial_end,
         payment_method_required=billing_required,
-        created_at=now,
+        created_at=now.isoformat(),
     )
 
 
@@ -169,51 +290,24 @@ def initialize_preferences(
     internal_id = user_data.internal_id
     custom_prefs = custom_prefs or {}
 
-    notifications = {
-        "email_updates": True,
-        "marketing_emails": plan != "enterprise",
-        "weekly_digest": True,
-        "security_alerts": True,
-        "product_updates": True,
-        "billing_alerts": plan != "starter",
-    }
-
-    ui_settings = {
-        "theme": "light",
-        "language": "en",
-        "timezone": "UTC",
-        "date_format": "YYYY-MM-DD",
-        "items_per_page": 25,
-        "sidebar_collapsed": False,
-    }
-
-    feature_flags = {
-        "beta_features": plan == "enterprise",
-        "advanced_analytics": plan in ("professional", "enterprise"),
-        "api_access": plan in ("professional", "enterprise"),
-        "custom_integrations": plan == "enterprise",
-        "priority_support": plan == "enterprise",
-        "export_data": True,
-    }
-
-    default_prefs = {**notifications, **ui_settings}
-    preferences = {**default_prefs, **custom_prefs}
+    template = _PREFERENCES_TEMPLATES.get(plan) or _build_preferences_template(plan)
+    preferences = {**template.defaults, **custom_prefs}
 
-    preferences_id = f"pref_{uuid.uuid4().hex[:12]}"
-    now = datetime.now(timezone.utc).isoformat()
+    preferences_id = f"pref_{os.urandom(6).hex()}"
+    now = _utc_now_iso()
 
     return MicroservicesInitPreferencesResult(
         preferences_id=preferences_id,
         user_id=user_id,
         plan=plan,
         preferences=preferences,
-        defaults_applied=len(default_prefs),
+        defaults_applied=len(template.defaults),
         customizations=len(custom_prefs),
         status="active",
         user_internal_id=internal_id,
-        notifications=notifications,
-        ui_settings=ui_settings,
-        feature_flags=feature_flags,
+        notifications=template.notifications,
+        ui_settings=UI_SETTINGS,
+        feature_flags=template.feature_flags,
         onboarding_completed=False,
         created_at=now,
         updated_at=now,
@@ -226,87 +320,32 @@ def send_welcome_sequence(
     prefs_data: MicroservicesInitPreferencesResult,
 ) -> MicroservicesSendWelcomeResult:
     """Send a multi-channel welcome sequence to the new user."""
-    if not all([user_data, billing_data, prefs_data]):
+    if user_data is None or billing_data is None or prefs_data is None:
         raise PermanentError("Missing upstream dependency results")
 
     user_id = user_data.user_id
-    email = user_data.email
     plan = user_data.plan or "starter"
-    full_name = user_data.full_name or user_data.name
-    verification_token = user_data.verification_token
-    trial_end = billing_data.trial_end
     prefs = prefs_data.preferences or {}
 
-    messages_sent_list: list[dict[str, Any]] = []
-
-    # Welcome email (if email notifications enabled)
-    if prefs.get("email_updates", True) or prefs.get("email_notifications", True):
-        welcome_msg_id = f"msg_{uuid.uuid4().hex[:16]}"
-        messages_sent_list.append(
-            {
-                "message_id": welcome_msg_id,
-                "channel": "email",
-                "recipient": email,
-                "template": "welcome_email_v3",
-                "subject": f"Welcome to Tasker, {full_name}!",
-                "status": "sent",
-            }
-        )
-
-    # Verification email
-    verify_msg_id = f"msg_{uuid.uuid4().hex[:16]}"
-    messages_sent_list.append(
-        {
-            "message_id": verify_msg_id,
-            "channel": "email",
-            "recipient": email,
-            "template": "email_verification",
-            "subject": "Verify your email address",
-            "verification_link": f"https://app.example.com/verify/{verification_token}",
-            "status": "sent",
-        }
-    )
-
-    # In-app onboarding
-    onboard_msg_id = f"msg_{uuid.uuid4().hex[:16]}"
-    messages_sent_list.append(
-        {
-            "message_id": onboard_msg_id,
-            "channel": "in_app",
-            "template": "onboarding_tour",
-            "status": "queued",
-        }
+    send_welcome_email = bool(
+        prefs.get("email_updates", True) or prefs.get("email_notifications", True)
     )
+    messages = _WELCOME_SEQUENCES[send_welcome_email, bool(billing_data.trial_end)]
+    total = len(messages)
 
-    # Trial notification if applicable
-    if trial_end:
-        trial_msg_id = f"msg_{uuid.uuid4().hex[:16]}"
-        messages_sent_list.append(
-            {
-                "message_id": trial_msg_id,
-                "channel": "email",
-                "recipient": email,
-                "template": "trial_started",
-                "subject": f"Your {plan} trial has started",
-                "trial_end": trial_end,
-                "status": "sent",
-            }
-        )
-
-    channels_used = list({m["channel"] for m in messages_sent_list})
-    welcome_sequence_id = f"welcome_{uuid.uuid4().hex[:12]}"
-    now = datetime.now(timezone.utc).isoformat()
+    welcome_sequence_id = f"welcome_{os.urandom(6).hex()}"
+    now = _utc_now_iso()
 
     return MicroservicesSendWelcomeResult(
         user_id=user_id,
         plan=plan,
-        channels_used=channels_used,
-        messages_sent=len(messages_sent_list),
+        channels_used=list(WELCOME_CHANNELS),
+        messages_sent=total,
         welcome_sequence_id=welcome_sequence_id,
         status="sent",
-        messages_sent_details=messages_sent_list,
-        total_messages=len(messages_sent_list),
-        sequence_id=f"seq_{uuid.uuid4().hex[:12]}",
+        messages_sent_details=messages,
+        total_messages=total,
+        sequence_id=f"seq_{os.urandom(6).hex()}",
         sent_at=now,
     )
 
@@ -318,7 +357,12 @@ def update_user_status(
     welcome_data: MicroservicesSendWelcomeResult,
 ) -> MicroservicesUpdateStatusResult:
     """Finalize user registration by activating the account."""
-    if not all([user_data, billing_data, preferences_data, welcome_data]):
+    if (
+        user_data is None
+        or billing_data is None
+        or preferences_data is None
+        or welcome_data is None
+    ):
         raise PermanentError("Missing upstream dependency results")
 
     user_id = user_data.user_id
@@ -328,6 +372,7 @@ def update_user_status(
     billing_id = billing_data.billing_id
     subscription_id = billing_data.subscription_id
     messages_sent = welcome_data.total_messages if welcome_data.total_messages is not None else (welcome_data.messages_sent or 0)
+    now = _utc_now_iso()
 
     registration_summary: dict[str, Any] = {
         "user_id": user_id,
@@ -335,17 +380,15 @@ def update_user_status(
         "plan": plan,
         "registration_status": "complete",
     }
-    if plan != "starter" and billing_data.billing_id:
-        registration_summary["billing_id"] = billing_data.billing_id
+    if plan != "starter" and billing_id:
+        registration_summary["billing_id"] = billing_id
         registration_summary["next_billing_date"] = billing_data.next_billing_date
     prefs = preferences_data.preferences or {}
     registration_summary["preferences_count"] = len(prefs) if isinstance(prefs, dict) else 0
     registration_summary["welcome_sent"] = True
     registration_summary["notification_channels"] = welcome_data.channels_used or []
     registration_summary["user_created_at"] = user_data.created_at
-    registration_summary["registration_completed_at"] = datetime.now(timezone.utc).isoformat()
-
-    now = datetime.now(timezone.utc).isoformat()
+    registration_summary["registration_completed_at"] = now
 
     return MicroservicesUpdateStatusResult(
         user_id=user_id,
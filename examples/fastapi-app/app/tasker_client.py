@@ -0,0 +1,57 @@
+"""Shared Tasker orchestration client for the FastAPI example app.
+
+TaskerClient only carries the initiator/source_system defaults stamped onto
+every task request, so one instance is built on first use and shared by all
+routes and background tasks instead of being reconstructed per request.
+
+Client calls are blocking FFI calls, so routes run them through
+run_tasker_call on a dedicated pool of TASKER_CLIENT_THREADS threads. The
+pool is separate from the event loop's default executor, which other
+libraries share; app.main shuts it down when the app stops.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextvars
+import functools
+import os
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, TypeVar
+
+from tasker_core.client import TaskerClient
+
+T = TypeVar("T")
+
+TASKER_CLIENT_THREADS = int(os.environ.get("APP_TASKER_CLIENT_THREADS", "16"))
+
+
+@functools.lru_cache(maxsize=1)
+def get_tasker_client() -> TaskerClient:
+    """Return the process-wide TaskerClient used by the example routes."""
+    return TaskerClient(initiator="fastapi-example", source_system="fastapi-example")
+
+
+@functools.lru_cache(maxsize=1)
+def _get_executor() -> ThreadPoolExecutor:
+    return ThreadPoolExecutor(
+        max_workers=TASKER_CLIENT_THREADS, thread_name_prefix="tasker-client"
+    )
+
+
+async def run_tasker_call(func: Callable[..., T], /, *args: Any, **kwargs: Any) -> T:
+    """Run a blocking TaskerClient call on the client pool.
+
+    Like asyncio.to_thread, the caller's context variables are carried over
+    to the worker thread.
+    """
+    call = functools.partial(contextvars.copy_context().run, func, *args, **kwargs)
+    return await asyncio.get_running_loop().run_in_executor(_get_executor(), call)
+
+
+def shutdown_tasker_executor() -> None:
+    """Wait for in-flight client calls, then release the pool's threads."""
+    if _get_executor.cache_info().currsize:
+        _get_executor().shutdown(wait=True, cancel_futures=True)
+        _get_executor.cache_clear()
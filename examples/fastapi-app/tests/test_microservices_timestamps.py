@@ -0,0 +1,53 @@
+"""Verify the cached microservices timestamp formatter matches datetime.isoformat().
+
+_utc_now_iso caches the formatted seconds prefix at module level, so these
+tests pin the clock and check both the cold and warm cache paths.
+
+Run with: uv run pytest tests/test_microservices_timestamps.py -v
+"""
+
+from __future__ import annotations
+
+import time
+from datetime import datetime, timezone
+
+import pytest
+
+from app.services import microservices
+
+
+def _expected(ns: int) -> str:
+    sec, usec = divmod(ns // 1000, 1_000_000)
+    return datetime.fromtimestamp(sec, timezone.utc).replace(microsecond=usec).isoformat()
+
+
+@pytest.fixture(autouse=True)
+def _cold_cache(monkeypatch):
+    monkeypatch.setattr(microservices, "_iso_second", (-1, ""))
+
+
+@pytest.mark.parametrize(
+    "ns",
+    [
+        1_700_000_000_000_000_000,  # whole second: no fractional part
+        1_700_000_000_000_001_000,  # 1 microsecond
+        1_700_000_000_123_456_789,  # sub-microsecond digits are truncated
+    ],
+    ids=["whole_second", "one_usec", "fractional"],
+)
+def test_utc_now_iso_matches_isoformat(monkeypatch, ns):
+    monkeypatch.setattr(time, "time_ns", lambda: ns)
+    assert microservices._utc_now_iso() == _expected(ns)
+
+
+def test_utc_now_iso_cache_follows_the_clock(monkeypatch):
+    """Calls within one second reuse the prefix; the next second replaces it."""
+    instants = [
+        1_700_000_000_250_000_000,
+        1_700_000_000_750_000_000,
+        1_700_000_001_000_000_000,
+    ]
+    for ns in instants:
+        monkeypatch.setattr(time, "time_ns", lambda ns=ns: ns)
+        assert microservices._utc_now_iso() == _expected(ns)
+        assert microservices._iso_second[0] == ns // 1_000_000_000
@@ -11,6 +11,9 @@ from __future__ import annotations
 
 import pytest
 from httpx import AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models import Order
 
 
 class TestEcommerceOrderWorkflow:
@@ -101,6 +104,26 @@ class TestEcommerceOrderWorkflow:
         assert data["id"] == order_id
         assert data["customer_email"] == "get-test@example.com"
 
+    @pytest.mark.asyncio
+    async def test_get_order_with_zero_total(
+        self, client: AsyncClient, db_session: AsyncSession
+    ) -> None:
+        """GET /orders/{id} returns a 0.00 total as 0.0, not null."""
+        order = Order(
+            customer_email="zero-total@example.com",
+            items=[],
+            total=0.00,
+            status="complete",
+        )
+        db_session.add(order)
+        await db_session.commit()
+
+        response = await client.get(f"/orders/{order.id}")
+        assert response.status_code == 200
+        data = response.json()
+        assert data["id"] == order.id
+        assert data["total"] == 0.0
+
     @pytest.mark.asyncio
     async def test_get_nonexistent_order(self, client: AsyncClient) -> None:
         """GET /orders/999999 returns 404."""